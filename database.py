@@ -1,6 +1,8 @@
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool
 import os
 from dotenv import load_dotenv
 
@@ -10,11 +12,25 @@ load_dotenv()
 # Database URL from environment
 SQLALCHEMY_DATABASE_URL = os.getenv("DATABASE_URL")
 
-# Create engine
-engine = create_engine(SQLALCHEMY_DATABASE_URL)
+# Connection pool sizing. Sync endpoints run in FastAPI's threadpool (40 threads
+# by default), so the pool should let each worker thread hold a connection
+# instead of queueing on the default 5 + 10
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "20"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+
+# Create engine. The sizing only applies to QueuePool; other pools (e.g. the
+# SingletonThreadPool of in-memory SQLite) reject these arguments
+engine_options = {}
+database_url = make_url(SQLALCHEMY_DATABASE_URL)
+if issubclass(database_url.get_dialect().get_pool_class(database_url), QueuePool):
+    engine_options.update(pool_size=DB_POOL_SIZE, max_overflow=DB_MAX_OVERFLOW)
+
+engine = create_engine(SQLALCHEMY_DATABASE_URL, **engine_options)
 
 # Create SessionLocal class
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Sessions live for a single request, so instances keep their values after
+# commit instead of being expired and re-SELECTed on the next attribute access
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
 
 # Create Base class
 Base = declarative_base()
@@ -1,23 +1,65 @@
-from typing import List, Set, Dict, Tuple
-from collections import deque, defaultdict
+from typing import List, Set, Dict, Tuple, Iterable, Optional
+from collections import Counter, deque
+from itertools import chain
+from operator import itemgetter
 import heapq
 
 
 class SocialGraph:
     """
     Graph data structure for managing social network relationships
-    Uses adjacency list representation for efficient operations
+    Uses adjacency set representation for O(1) membership, add and remove
     """
     
+    __slots__ = (
+        "adjacency_list",
+        "reverse_adjacency_list",
+        "follower_count",
+        "following_count",
+        "total_connections",
+    )
+    
     def __init__(self):
-        self.adjacency_list: Dict[int, List[int]] = {}  # {user_id: [followed_user_ids]}
-        self.reverse_adjacency_list: Dict[int, List[int]] = {}  # {user_id: [follower_ids]}
+        self.adjacency_list: Dict[int, Set[int]] = {}  # {user_id: {followed_user_ids}}
+        self.reverse_adjacency_list: Dict[int, Set[int]] = {}  # {user_id: {follower_ids}}
+        self.follower_count: Dict[int, int] = {}  # {user_id: number of followers}
+        self.following_count: Dict[int, int] = {}  # {user_id: number of users followed}
+        self.total_connections = 0  # number of follow edges in the graph
     
     def add_user(self, user_id: int):
         """Add a user node to the graph"""
-        if user_id not in self.adjacency_list:
-            self.adjacency_list[user_id] = []
-            self.reverse_adjacency_list[user_id] = []
+        self.adjacency_list.setdefault(user_id, set())
+        self.reverse_adjacency_list.setdefault(user_id, set())
+        self.follower_count.setdefault(user_id, 0)
+        self.following_count.setdefault(user_id, 0)
+    
+    def bulk_load(self, user_ids: Iterable[int], edges: Iterable[Tuple[int, int]]):
+        """
+        Replace the graph with the given users and (follower_id, followed_id) edges
+        Builds the adjacency sets directly and derives the counts once at the end,
+        skipping the per-edge bookkeeping of follow_user
+        Time Complexity: O(V + E)
+        """
+        adjacency: Dict[int, Set[int]] = {user_id: set() for user_id in user_ids}
+        reverse_adjacency: Dict[int, Set[int]] = {user_id: set() for user_id in adjacency}
+        
+        for follower_id, followed_id in edges:
+            following = adjacency.get(follower_id)
+            if following is None:
+                following = adjacency[follower_id] = set()
+                reverse_adjacency[follower_id] = set()
+            if followed_id not in adjacency:
+                adjacency[followed_id] = set()
+                reverse_adjacency[followed_id] = set()
+            
+            following.add(followed_id)
+            reverse_adjacency[followed_id].add(follower_id)
+        
+        self.adjacency_list = adjacency
+        self.reverse_adjacency_list = reverse_adjacency
+        self.following_count = {user_id: len(s) for user_id, s in adjacency.items()}
+        self.follower_count = {user_id: len(s) for user_id, s in reverse_adjacency.items()}
+        self.total_connections = sum(self.following_count.values())
     
     def follow_user(self, follower_id: int, followed_id: int):
         """
@@ -29,55 +71,83 @@ class SocialGraph:
         if followed_id not in self.adjacency_list:
             self.add_user(followed_id)
         
-        # Add to adjacency list if not already following
+        # Add to adjacency sets if not already following
         if followed_id not in self.adjacency_list[follower_id]:
-            self.adjacency_list[follower_id].append(followed_id)
-            self.reverse_adjacency_list[followed_id].append(follower_id)
+            self.adjacency_list[follower_id].add(followed_id)
+            self.reverse_adjacency_list[followed_id].add(follower_id)
+            self.following_count[follower_id] += 1
+            self.follower_count[followed_id] += 1
+            self.total_connections += 1
     
     def unfollow_user(self, follower_id: int, followed_id: int):
         """
         Remove the directed edge from follower to followed
-        Time Complexity: O(n) where n is number of people user follows
+        Time Complexity: O(1)
         """
-        if follower_id in self.adjacency_list:
-            if followed_id in self.adjacency_list[follower_id]:
-                self.adjacency_list[follower_id].remove(followed_id)
-                self.reverse_adjacency_list[followed_id].remove(follower_id)
+        if followed_id in self.adjacency_list.get(follower_id, ()):
+            self.adjacency_list[follower_id].discard(followed_id)
+            self.reverse_adjacency_list[followed_id].discard(follower_id)
+            self.following_count[follower_id] -= 1
+            self.follower_count[followed_id] -= 1
+            self.total_connections -= 1
     
     def get_following(self, user_id: int) -> List[int]:
         """
         Get list of users that user_id follows
-        Time Complexity: O(1)
+        Time Complexity: O(k) where k is following count (returns a copy)
         """
-        return self.adjacency_list.get(user_id, [])
+        return list(self.adjacency_list.get(user_id, ()))
     
     def get_followers(self, user_id: int) -> List[int]:
         """
         Get list of users following user_id
+        Time Complexity: O(k) where k is follower count (returns a copy)
+        """
+        return list(self.reverse_adjacency_list.get(user_id, ()))
+    
+    def get_following_count(self, user_id: int) -> int:
+        """
+        Get number of users that user_id follows
         Time Complexity: O(1)
         """
-        return self.reverse_adjacency_list.get(user_id, [])
+        return self.following_count.get(user_id, 0)
+    
+    def get_followers_count(self, user_id: int) -> int:
+        """
+        Get number of users following user_id
+        Time Complexity: O(1)
+        """
+        return self.follower_count.get(user_id, 0)
     
     def is_following(self, follower_id: int, followed_id: int) -> bool:
-        """Check if follower_id follows followed_id"""
-        return followed_id in self.adjacency_list.get(follower_id, [])
+        """
+        Check if follower_id follows followed_id
+        Time Complexity: O(1)
+        """
+        return followed_id in self.adjacency_list.get(follower_id, ())
     
-    def get_mutual_followers(self, user1_id: int, user2_id: int) -> List[int]:
+    def get_mutual_followers(self, user1_id: int, user2_id: int) -> Set[int]:
         """
         Find users that both user1 and user2 follow (mutual following)
-        Time Complexity: O(n + m) where n and m are following counts
+        Time Complexity: O(min(n, m)) where n and m are following counts
+        
+        Returns: A new set, safe for the caller to keep or modify
         """
-        following1 = set(self.get_following(user1_id))
-        following2 = set(self.get_following(user2_id))
-        return list(following1.intersection(following2))
+        following1 = self.adjacency_list.get(user1_id, set())
+        following2 = self.adjacency_list.get(user2_id, set())
+        # set & set probes the smaller operand against the larger one
+        return following1 & following2
     
-    def get_mutual_friends(self, user1_id: int, user2_id: int) -> List[int]:
+    def get_mutual_friends(self, user1_id: int, user2_id: int) -> Set[int]:
         """
         Find users who follow both user1 and user2 (mutual friends)
+        Time Complexity: O(min(n, m)) where n and m are follower counts
+        
+        Returns: A new set, safe for the caller to keep or modify
         """
-        followers1 = set(self.get_followers(user1_id))
-        followers2 = set(self.get_followers(user2_id))
-        return list(followers1.intersection(followers2))
+        followers1 = self.reverse_adjacency_list.get(user1_id, set())
+        followers2 = self.reverse_adjacency_list.get(user2_id, set())
+        return followers1 & followers2
     
     def suggest_users_to_follow(self, user_id: int, limit: int = 5) -> List[Tuple[int, int]]:
         """
@@ -88,29 +158,36 @@ class SocialGraph:
         Returns: List of (user_id, score) tuples sorted by score
         Time Complexity: O(n * m) where n is following count and m is avg following per user
         """
-        following = set(self.get_following(user_id))
-        suggestions = defaultdict(int)
+        adjacency = self.adjacency_list
+        following = adjacency.get(user_id, set())
         
-        # Find friends of friends and count occurrences (weight by popularity)
-        for followed_user in following:
-            for potential_follow in self.get_following(followed_user):
-                # Don't suggest users already following or self
-                if potential_follow != user_id and potential_follow not in following:
-                    suggestions[potential_follow] += 1
+        # Find friends of friends and count occurrences - Counter does the
+        # counting loop in C over the chained following sets
+        suggestions = Counter(chain.from_iterable(
+            adjacency[followed_user] for followed_user in following
+        ))
         
-        # Add popularity score (number of followers)
-        for suggested_user in suggestions:
-            follower_count = len(self.get_followers(suggested_user))
-            suggestions[suggested_user] += follower_count * 0.1  # Weight factor
+        # Don't suggest users already following or self
+        suggestions.pop(user_id, None)
+        for followed_user in following:
+            suggestions.pop(followed_user, None)
         
-        # Sort by score and return top suggestions
-        sorted_suggestions = sorted(suggestions.items(), key=lambda x: x[1], reverse=True)
-        return sorted_suggestions[:limit]
+        # Add popularity score (number of followers) while selecting the top
+        # suggestions, so candidates are walked once - O(n log limit)
+        follower_count = self.follower_count
+        scored = (
+            (suggested_user, mutual_count + follower_count[suggested_user] * 0.1)  # Weight factor
+            for suggested_user, mutual_count in suggestions.items()
+        )
+        return heapq.nlargest(limit, scored, key=itemgetter(1))
     
     def shortest_path_bfs(self, start_user: int, end_user: int) -> List[int]:
         """
-        Find shortest connection path between two users using BFS
-        Time Complexity: O(V + E) where V is vertices and E is edges
+        Find shortest connection path between two users using bidirectional BFS
+        Searches forward along following edges from start_user and backward along
+        follower edges from end_user, always expanding the smaller frontier
+        Time Complexity: O(b^(d/2)) where b is branching factor and d is path length
+        Space Complexity: O(V) - only parent pointers are stored, not paths
         
         Returns: List of user IDs representing the path, empty if no path exists
         """
@@ -120,27 +197,77 @@ class SocialGraph:
         if start_user == end_user:
             return [start_user]
         
-        visited = set()
-        queue = deque([(start_user, [start_user])])
+        # parents double as the visited sets; depths pick the best meeting point
+        forward_parents: Dict[int, Optional[int]] = {start_user: None}
+        backward_parents: Dict[int, Optional[int]] = {end_user: None}
+        forward_depths = {start_user: 0}
+        backward_depths = {end_user: 0}
+        forward_frontier = [start_user]
+        backward_frontier = [end_user]
         
-        while queue:
-            current_user, path = queue.popleft()
-            
-            if current_user in visited:
-                continue
-            
-            visited.add(current_user)
+        while forward_frontier and backward_frontier:
+            if len(forward_frontier) <= len(backward_frontier):
+                forward_frontier, meeting = self._expand_frontier(
+                    forward_frontier, self.adjacency_list,
+                    forward_parents, forward_depths, backward_depths
+                )
+            else:
+                backward_frontier, meeting = self._expand_frontier(
+                    backward_frontier, self.reverse_adjacency_list,
+                    backward_parents, backward_depths, forward_depths
+                )
             
-            # Check all users that current_user follows
-            for neighbor in self.adjacency_list.get(current_user, []):
-                if neighbor == end_user:
-                    return path + [neighbor]
-                
-                if neighbor not in visited:
-                    queue.append((neighbor, path + [neighbor]))
+            if meeting is not None:
+                # Stitch start -> meeting with meeting -> end
+                path = self._build_path(forward_parents, meeting)
+                node = backward_parents[meeting]
+                while node is not None:
+                    path.append(node)
+                    node = backward_parents[node]
+                return path
         
         return []  # No path found
     
+    @staticmethod
+    def _expand_frontier(frontier: List[int], neighbors: Dict[int, Set[int]],
+                         parents: Dict[int, Optional[int]], depths: Dict[int, int],
+                         other_depths: Dict[int, int]) -> Tuple[List[int], Optional[int]]:
+        """
+        Expand one full BFS level of a bidirectional search
+        
+        Returns: (next frontier, meeting node closest to the other side or None)
+        """
+        next_frontier = []
+        meeting = None
+        next_depth = depths[frontier[0]] + 1
+        
+        for current_user in frontier:
+            for neighbor in neighbors[current_user]:
+                if neighbor in parents:
+                    continue
+                
+                parents[neighbor] = current_user
+                depths[neighbor] = next_depth
+                next_frontier.append(neighbor)
+                
+                if neighbor in other_depths and (
+                    meeting is None or other_depths[neighbor] < other_depths[meeting]
+                ):
+                    meeting = neighbor
+        
+        return next_frontier, meeting
+    
+    @staticmethod
+    def _build_path(parents: Dict[int, Optional[int]], end_user: int) -> List[int]:
+        """Walk parent pointers back from end_user and return the path in order"""
+        path = []
+        node = end_user
+        while node is not None:
+            path.append(node)
+            node = parents[node]
+        path.reverse()
+        return path
+    
     def get_degrees_of_separation(self, user1_id: int, user2_id: int) -> int:
         """
         Calculate degrees of separation between two users
@@ -151,50 +278,96 @@ class SocialGraph:
             return -1
         return len(path) - 1
     
+    def batch_degrees_of_separation(self, pairs: List[Tuple[int, int]]) -> List[int]:
+        """
+        Calculate degrees of separation for many (user, target) pairs at once
+        Pairs sharing a source user are answered from a single BFS
+        
+        Returns: List of degrees in the same order as pairs, -1 where no connection exists
+        Time Complexity: O(S * (V + E)) where S is the number of distinct source users
+        """
+        targets_by_source: Dict[int, Set[int]] = {}
+        for source, target in pairs:
+            targets_by_source.setdefault(source, set()).add(target)
+        
+        distances = {
+            source: self._bfs_distances(source, targets)
+            for source, targets in targets_by_source.items()
+        }
+        return [distances[source].get(target, -1) for source, target in pairs]
+    
+    def _bfs_distances(self, start_user: int, targets: Set[int]) -> Dict[int, int]:
+        """
+        BFS from start_user, stopping once every target in the graph has a distance
+        Targets that are not users in the graph are ignored; a target that is in the
+        graph but unreachable from start_user still makes the BFS run to exhaustion
+        """
+        adjacency = self.adjacency_list
+        if start_user not in adjacency:
+            return {}
+        
+        distances = {start_user: 0}
+        remaining = len((targets & adjacency.keys()) - distances.keys())
+        queue = deque([start_user])
+        dequeue, enqueue = queue.popleft, queue.append
+        
+        while queue and remaining:
+            current_user = dequeue()
+            next_distance = distances[current_user] + 1
+            
+            for neighbor in adjacency[current_user]:
+                if neighbor in distances:
+                    continue
+                
+                distances[neighbor] = next_distance
+                if neighbor in targets:
+                    remaining -= 1
+                enqueue(neighbor)
+        
+        return distances
+    
     def get_influencers(self, min_followers: int = 100, limit: int = 10) -> List[Tuple[int, int]]:
         """
         Find most influential users (users with most followers)
         
         Returns: List of (user_id, follower_count) tuples
         """
-        influencers = []
-        
-        for user_id, followers in self.reverse_adjacency_list.items():
-            follower_count = len(followers)
-            if follower_count >= min_followers:
-                influencers.append((user_id, follower_count))
+        influencers = self.follower_count.items()
+        if min_followers > 0:
+            # Lazy filter: nlargest consumes it directly, no intermediate list
+            influencers = (
+                (user_id, count) for user_id, count in influencers if count >= min_followers
+            )
         
-        # Sort by follower count
-        influencers.sort(key=lambda x: x[1], reverse=True)
-        return influencers[:limit]
+        # Top-k by follower count
+        return heapq.nlargest(limit, influencers, key=itemgetter(1))
     
     def get_community_size(self, user_id: int, max_depth: int = 3) -> int:
         """
         Calculate the size of a user's community up to max_depth connections
-        Uses BFS to explore the network
+        Uses level-by-level BFS where each frontier is a set: the next level is the
+        union of neighbour sets minus visited, so per-edge work runs in C set ops
         """
         if user_id not in self.adjacency_list:
             return 0
         
-        visited = set()
-        queue = deque([(user_id, 0)])
+        following, followers = self.adjacency_list, self.reverse_adjacency_list
+        visited = {user_id}
+        frontier = {user_id}
         
-        while queue:
-            current_user, depth = queue.popleft()
-            
-            if current_user in visited or depth > max_depth:
-                continue
-            
-            visited.add(current_user)
-            
+        for _ in range(max_depth):
             # Explore both following and followers
-            for neighbor in self.adjacency_list.get(current_user, []):
-                if neighbor not in visited:
-                    queue.append((neighbor, depth + 1))
+            next_frontier = set()
+            for current_user in frontier:
+                next_frontier |= following[current_user]
+                next_frontier |= followers[current_user]
             
-            for follower in self.reverse_adjacency_list.get(current_user, []):
-                if follower not in visited:
-                    queue.append((follower, depth + 1))
+            next_frontier -= visited
+            if not next_frontier:
+                break
+            
+            visited |= next_frontier
+            frontier = next_frontier
         
         return len(visited)
     
@@ -204,25 +377,30 @@ class SocialGraph:
         
         Returns: List of (user_id, follower_count) tuples
         """
-        following = self.get_following(user_id)
+        following = self.adjacency_list.get(user_id, ())
         popular_users = []
         
         for followed_user in following:
-            follower_count = len(self.get_followers(followed_user))
-            popular_users.append((followed_user, follower_count))
+            popular_users.append((followed_user, self.follower_count[followed_user]))
         
-        popular_users.sort(key=lambda x: x[1], reverse=True)
-        return popular_users[:limit]
+        return heapq.nlargest(limit, popular_users, key=itemgetter(1))
     
     def detect_mutual_following(self, user1_id: int, user2_id: int) -> bool:
-        """Check if two users follow each other (mutual following)"""
-        return (self.is_following(user1_id, user2_id) and 
-                self.is_following(user2_id, user1_id))
+        """
+        Check if two users follow each other (mutual following)
+        Time Complexity: O(1) - two set lookups
+        """
+        adjacency = self.adjacency_list
+        return (user2_id in adjacency.get(user1_id, ()) and
+                user1_id in adjacency.get(user2_id, ()))
     
     def get_network_stats(self) -> Dict:
-        """Get overall network statistics"""
+        """
+        Get overall network statistics
+        Time Complexity: O(1) - edge total is maintained on follow/unfollow
+        """
         total_users = len(self.adjacency_list)
-        total_connections = sum(len(following) for following in self.adjacency_list.values())
+        total_connections = self.total_connections
         
         # Calculate average followers per user
         avg_followers = total_connections / total_users if total_users > 0 else 0
@@ -1,8 +1,14 @@
-from fastapi import FastAPI, Depends, HTTPException, status
+from fastapi import FastAPI, Depends, HTTPException, Request, Response, status
+from fastapi.exceptions import RequestValidationError
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
-from typing import List
+from sqlalchemy import and_, exists, func, or_, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, selectinload
+from pydantic import ValidationError
+from typing import List, Optional
+from collections import OrderedDict, namedtuple
 from datetime import timedelta
+from threading import Lock
 
 import models
 import schemas
@@ -23,6 +29,221 @@ app = FastAPI(
 # Initialize social graph
 social_graph = SocialGraph()
 
+# Responses of the read-only graph analytics endpoints, keyed by
+# (endpoint, user_id, params). The graph lives in this process and only changes
+# through register/follow/unfollow, which clear the cache, so no external cache
+# server is needed. Each clear bumps the generation; a response computed while a
+# write landed carries the older generation and is not stored, so a concurrent
+# write cannot leave a stale entry behind. Per-user keys are bounded by evicting
+# the least recently used entry.
+GRAPH_CACHE_MAX_ENTRIES = 1024
+graph_response_cache: "OrderedDict[tuple, object]" = OrderedDict()
+graph_cache_generation = 0
+graph_cache_lock = Lock()
+
+
+def get_cached_graph_response(key: tuple) -> Optional[object]:
+    """Return a cached graph response, marking it recently used, or None on a miss"""
+    with graph_cache_lock:
+        response = graph_response_cache.get(key)
+        if response is not None:
+            graph_response_cache.move_to_end(key)
+        return response
+
+
+def get_graph_cache_generation() -> int:
+    """Return the cache generation; capture it before computing a response"""
+    with graph_cache_lock:
+        return graph_cache_generation
+
+
+def cache_graph_response(key: tuple, response: object, generation: int):
+    """
+    Store a graph response computed at the given generation, evicting the least
+    recently used entry when full; skip it if the cache was invalidated since
+    """
+    with graph_cache_lock:
+        if generation != graph_cache_generation:
+            return
+        graph_response_cache[key] = response
+        graph_response_cache.move_to_end(key)
+        if len(graph_response_cache) > GRAPH_CACHE_MAX_ENTRIES:
+            graph_response_cache.popitem(last=False)
+
+
+def invalidate_graph_cache():
+    """Drop cached graph analytics after the graph or displayed user data changes"""
+    global graph_cache_generation
+    with graph_cache_lock:
+        graph_cache_generation += 1
+        graph_response_cache.clear()
+
+
+# Correlated COUNT subqueries so list endpoints fetch counts with the rows
+# themselves instead of lazy-loading liked_by/comments per post (N+1)
+post_likes_count = (
+    select(func.count())
+    .where(models.post_likes.c.post_id == models.Post.id)
+    .correlate(models.Post)
+    .scalar_subquery()
+    .label("likes_count")
+)
+post_comments_count = (
+    select(func.count(models.Comment.id))
+    .where(models.Comment.post_id == models.Post.id)
+    .correlate(models.Post)
+    .scalar_subquery()
+    .label("comments_count")
+)
+user_posts_count = (
+    select(func.count(models.Post.id))
+    .where(models.Post.author_id == models.User.id)
+    .correlate(models.User)
+    .scalar_subquery()
+    .label("posts_count")
+)
+comment_likes_count = (
+    select(func.count())
+    .where(models.comment_likes.c.comment_id == models.Comment.id)
+    .correlate(models.Comment)
+    .scalar_subquery()
+    .label("likes_count")
+)
+
+
+def association_exists(db: Session, table, **columns) -> bool:
+    """Check for a follow/like row with an indexed EXISTS instead of loading the collection"""
+    conditions = [table.c[name] == value for name, value in columns.items()]
+    return db.query(exists().where(*conditions)).scalar()
+
+
+def count_likes(db: Session, table, **columns) -> int:
+    """Count rows in a like association table with a single COUNT query"""
+    conditions = [table.c[name] == value for name, value in columns.items()]
+    return db.query(func.count()).select_from(table).filter(*conditions).scalar()
+
+
+# Column attributes exposed by UserResponse; read explicitly so responses never
+# depend on what happens to be loaded in the instance __dict__
+USER_RESPONSE_FIELDS = tuple(schemas.UserResponse.model_fields)
+
+
+def user_columns(user: models.User) -> dict:
+    """Build a plain dict of the user's response columns"""
+    return {field: getattr(user, field) for field in USER_RESPONSE_FIELDS}
+
+
+# User lists select only the UserResponse columns (never hashed_password) and
+# return them as namedtuples instead of hydrating full User instances
+USER_RECORD_COLUMNS = tuple(getattr(models.User, field) for field in USER_RESPONSE_FIELDS)
+UserRecord = namedtuple("UserRecord", USER_RESPONSE_FIELDS)
+
+
+def query_user_records(db: Session):
+    """Query the UserResponse columns of users; wrap each row with UserRecord(*row)"""
+    return db.query(*USER_RECORD_COLUMNS)
+
+
+# Posts on list endpoints are selected as plain columns, author included, and
+# wrapped in namedtuples: responses are built without hydrating ORM instances,
+# identity-map lookups or instrumented attribute access on every field
+POST_RECORD_FIELDS = tuple(
+    field for field in schemas.PostResponse.model_fields
+    if field not in ("author", "likes_count", "comments_count")
+)
+PostRecord = namedtuple("PostRecord", POST_RECORD_FIELDS + ("author", "likes_count", "comments_count"))
+POST_COLUMNS_END = len(POST_RECORD_FIELDS)
+AUTHOR_COLUMNS_END = POST_COLUMNS_END + len(USER_RESPONSE_FIELDS)
+
+
+def query_post_records(db: Session):
+    """
+    Query post columns, author columns, likes_count and comments_count in a single SELECT
+    Turn the rows into responses with post_record()
+    """
+    return db.query(
+        *(getattr(models.Post, field) for field in POST_RECORD_FIELDS),
+        *USER_RECORD_COLUMNS,
+        post_likes_count,
+        post_comments_count
+    ).join(models.Post.author)
+
+
+def post_record(row) -> PostRecord:
+    """Split a query_post_records() row into a PostRecord with a nested UserRecord"""
+    return PostRecord(
+        *row[:POST_COLUMNS_END],
+        UserRecord(*row[POST_COLUMNS_END:AUTHOR_COLUMNS_END]),
+        *row[AUTHOR_COLUMNS_END:]
+    )
+
+
+def posts_after(after_id: int):
+    """
+    Keyset pagination condition for posts ordered by (created_at DESC, id DESC):
+    matches posts that come after the post with id after_id, seeking via the
+    index instead of scanning and discarding OFFSET rows
+    """
+    cursor_created_at = (
+        select(models.Post.created_at)
+        .where(models.Post.id == after_id)
+        .scalar_subquery()
+    )
+    return or_(
+        models.Post.created_at < cursor_created_at,
+        and_(models.Post.created_at == cursor_created_at, models.Post.id < after_id)
+    )
+
+
+def model_response(model, content, status_code: int = status.HTTP_200_OK) -> Response:
+    """
+    Validate content against a response model once and encode it to JSON in pydantic-core
+    Returning a Response skips FastAPI's second validate/dump/json.dumps pass;
+    the route's response_model still documents the schema
+    """
+    return Response(
+        content=model.model_validate(content).model_dump_json(),
+        status_code=status_code,
+        media_type="application/json"
+    )
+
+
+def list_response(adapter, items) -> Response:
+    """
+    Validate and encode a list response with one of the prebuilt schemas adapters
+    Like model_response(), this bypasses FastAPI's per-request response processing
+    """
+    return Response(
+        content=adapter.dump_json(adapter.validate_python(items, from_attributes=True)),
+        media_type="application/json"
+    )
+
+
+def json_body(model):
+    """
+    Dependency that parses and validates a JSON request body in a single
+    pydantic-core pass (model_validate_json) instead of json.loads + validation
+    Invalid bodies still get FastAPI's usual 422 with "body"-prefixed locations
+    """
+    async def parse_body(request: Request):
+        try:
+            return model.model_validate_json(await request.body())
+        except ValidationError as e:
+            raise RequestValidationError(
+                [{**error, "loc": ("body", *error["loc"])} for error in e.errors()]
+            )
+    return parse_body
+
+
+def json_body_docs(model) -> dict:
+    """openapi_extra documenting the request body of a route that uses json_body()"""
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": model.model_json_schema()}}
+        }
+    }
+
 
 # Load existing relationships into graph on startup
 @app.on_event("startup")
@@ -30,11 +251,14 @@ def load_graph():
     """Load all user relationships into the graph structure on startup"""
     db = next(get_db())
     try:
-        users = db.query(models.User).all()
-        for user in users:
-            social_graph.add_user(user.id)
-            for followed in user.following:
-                social_graph.follow_user(user.id, followed.id)
+        # Two flat scans instead of loading every user's following collection;
+        # edges are streamed straight from the association table
+        user_ids = db.execute(select(models.User.id)).scalars().all()
+        edges = db.execute(
+            select(models.followers.c.follower_id, models.followers.c.followed_id)
+            .execution_options(yield_per=10000)
+        )
+        social_graph.bulk_load(user_ids, edges)
         
         stats = social_graph.get_network_stats()
         print(f"✅ Graph loaded: {stats}")
@@ -62,8 +286,16 @@ def health_check():
 
 # ==================== AUTHENTICATION ====================
 
-@app.post("/register", response_model=schemas.UserResponse, status_code=status.HTTP_201_CREATED)
-def register(user: schemas.UserCreate, db: Session = Depends(get_db)):
+@app.post(
+    "/register",
+    response_model=schemas.UserResponse,
+    status_code=status.HTTP_201_CREATED,
+    openapi_extra=json_body_docs(schemas.UserCreate)
+)
+def register(
+    user: schemas.UserCreate = Depends(json_body(schemas.UserCreate)),
+    db: Session = Depends(get_db)
+):
     """Register a new user"""
     # Check if username exists
     db_user = db.query(models.User).filter(models.User.username == user.username).first()
@@ -87,12 +319,12 @@ def register(user: schemas.UserCreate, db: Session = Depends(get_db)):
     
     db.add(db_user)
     db.commit()
-    db.refresh(db_user)
     
     # Add user to graph
     social_graph.add_user(db_user.id)
+    invalidate_graph_cache()
     
-    return db_user
+    return model_response(schemas.UserResponse, db_user, status.HTTP_201_CREATED)
 
 
 @app.post("/login", response_model=schemas.Token)
@@ -111,7 +343,8 @@ def login(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depend
         data={"sub": user.username}, expires_delta=access_token_expires
     )
     
-    return {"access_token": access_token, "token_type": "bearer"}
+    token = schemas.Token(access_token=access_token, token_type="bearer")
+    return Response(content=schemas.TOKEN_ADAPTER.dump_json(token), media_type="application/json")
 
 
 # ==================== USER ENDPOINTS ====================
@@ -122,16 +355,18 @@ def get_current_user_profile(
     db: Session = Depends(get_db)
 ):
     """Get current user's profile with statistics"""
-    followers_count = len(social_graph.get_followers(current_user.id))
-    following_count = len(social_graph.get_following(current_user.id))
-    posts_count = db.query(models.Post).filter(models.Post.author_id == current_user.id).count()
-    
-    return {
-        **current_user.__dict__,
+    followers_count = social_graph.get_followers_count(current_user.id)
+    following_count = social_graph.get_following_count(current_user.id)
+    posts_count = db.query(func.count(models.Post.id)).filter(
+        models.Post.author_id == current_user.id
+    ).scalar()
+    
+    return model_response(schemas.UserWithStats, {
+        **user_columns(current_user),
         "followers_count": followers_count,
         "following_count": following_count,
         "posts_count": posts_count
-    }
+    })
 
 
 @app.put("/users/me", response_model=schemas.UserResponse)
@@ -141,26 +376,34 @@ def update_current_user(
     db: Session = Depends(get_db)
 ):
     """Update current user's profile"""
-    if user_update.full_name is not None:
-        current_user.full_name = user_update.full_name
-    if user_update.bio is not None:
-        current_user.bio = user_update.bio
+    for field, value in user_update.changed_fields().items():
+        setattr(current_user, field, value)
     
     db.commit()
-    db.refresh(current_user)
-    return current_user
+    
+    # Influencer lists show full_name
+    invalidate_graph_cache()
+    return model_response(schemas.UserResponse, current_user)
 
 
 @app.get("/users", response_model=List[schemas.UserResponse])
 def get_all_users(
     skip: int = 0,
     limit: int = 20,
+    after_id: Optional[int] = None,
     current_user: models.User = Depends(auth.get_current_active_user),
     db: Session = Depends(get_db)
 ):
-    """Get all users (paginated)"""
-    users = db.query(models.User).offset(skip).limit(limit).all()
-    return users
+    """
+    Get all users (paginated)
+    Pass the last user's id as after_id to fetch the next page by key instead of skip
+    """
+    query = query_user_records(db)
+    if after_id is not None:
+        query = query.filter(models.User.id > after_id)
+    
+    rows = query.order_by(models.User.id).offset(skip).limit(limit).all()
+    return list_response(schemas.USER_LIST_ADAPTER, [UserRecord(*row) for row in rows])
 
 
 @app.get("/users/{user_id}", response_model=schemas.UserWithStats)
@@ -170,20 +413,22 @@ def get_user_by_id(
     db: Session = Depends(get_db)
 ):
     """Get user by ID with statistics"""
-    user = db.query(models.User).filter(models.User.id == user_id).first()
-    if not user:
+    # User and posts_count are fetched together in one round-trip;
+    # follower counts come from the in-memory graph
+    row = db.query(models.User, user_posts_count).filter(models.User.id == user_id).first()
+    if not row:
         raise HTTPException(status_code=404, detail="User not found")
     
-    followers_count = len(social_graph.get_followers(user.id))
-    following_count = len(social_graph.get_following(user.id))
-    posts_count = db.query(models.Post).filter(models.Post.author_id == user.id).count()
+    user, posts_count = row
+    followers_count = social_graph.get_followers_count(user.id)
+    following_count = social_graph.get_following_count(user.id)
     
-    return {
-        **user.__dict__,
+    return model_response(schemas.UserWithStats, {
+        **user_columns(user),
         "followers_count": followers_count,
         "following_count": following_count,
         "posts_count": posts_count
-    }
+    })
 
 
 @app.get("/users/search/{username}", response_model=List[schemas.UserResponse])
@@ -193,10 +438,19 @@ def search_users(
     db: Session = Depends(get_db)
 ):
     """Search users by username"""
-    users = db.query(models.User).filter(
-        models.User.username.contains(username)
-    ).limit(10).all()
-    return users
+    limit = 10
+    # Prefix matches come first and are a range scan on the username index;
+    # the unindexable '%...%' scan only runs when they don't fill the page
+    is_prefix = models.User.username.startswith(username, autoescape=True)
+    rows = query_user_records(db).filter(is_prefix).order_by(
+        models.User.username
+    ).limit(limit).all()
+    if len(rows) < limit:
+        rows += query_user_records(db).filter(
+            models.User.username.contains(username, autoescape=True),
+            ~is_prefix
+        ).limit(limit - len(rows)).all()
+    return list_response(schemas.USER_LIST_ADAPTER, [UserRecord(*row) for row in rows])
 
 
 # ==================== FOLLOW/UNFOLLOW ENDPOINTS ====================
@@ -211,24 +465,32 @@ def follow_user(
     if user_id == current_user.id:
         raise HTTPException(status_code=400, detail="You cannot follow yourself")
     
-    user_to_follow = db.query(models.User).filter(models.User.id == user_id).first()
-    if not user_to_follow:
+    # Only the username is needed for the response
+    username = db.query(models.User.username).filter(models.User.id == user_id).scalar()
+    if username is None:
         raise HTTPException(status_code=404, detail="User not found")
     
     # Check if already following
-    if user_to_follow in current_user.following:
+    if association_exists(db, models.followers, follower_id=current_user.id, followed_id=user_id):
         raise HTTPException(status_code=400, detail="Already following this user")
     
-    # Add to database
-    current_user.following.append(user_to_follow)
-    db.commit()
+    # Add to database; the unique (follower_id, followed_id) index, where
+    # present, turns a concurrent duplicate follow into the same 400
+    try:
+        db.execute(models.followers.insert().values(follower_id=current_user.id, followed_id=user_id))
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(status_code=400, detail="Already following this user")
     
     # Update graph
     social_graph.follow_user(current_user.id, user_id)
+    invalidate_graph_cache()
     
     return {
-        "message": f"You are now following {user_to_follow.username}",
-        "is_mutual": social_graph.detect_mutual_following(current_user.id, user_id)
+        "message": f"You are now following {username}",
+        # The follow just happened, so mutual only depends on the reverse edge
+        "is_mutual": social_graph.is_following(user_id, current_user.id)
     }
 
 
@@ -244,15 +506,19 @@ def unfollow_user(
         raise HTTPException(status_code=404, detail="User not found")
     
     # Check if following
-    if user_to_unfollow not in current_user.following:
+    if not association_exists(db, models.followers, follower_id=current_user.id, followed_id=user_id):
         raise HTTPException(status_code=400, detail="You are not following this user")
     
     # Remove from database
-    current_user.following.remove(user_to_unfollow)
+    db.execute(models.followers.delete().where(
+        models.followers.c.follower_id == current_user.id,
+        models.followers.c.followed_id == user_id
+    ))
     db.commit()
     
     # Update graph
     social_graph.unfollow_user(current_user.id, user_id)
+    invalidate_graph_cache()
     
     return {"message": f"You have unfollowed {user_to_unfollow.username}"}
 
@@ -265,8 +531,8 @@ def get_user_followers(
 ):
     """Get user's followers"""
     follower_ids = social_graph.get_followers(user_id)
-    followers = db.query(models.User).filter(models.User.id.in_(follower_ids)).all()
-    return followers
+    rows = query_user_records(db).filter(models.User.id.in_(follower_ids)).all()
+    return list_response(schemas.USER_LIST_ADAPTER, [UserRecord(*row) for row in rows])
 
 
 @app.get("/users/{user_id}/following", response_model=List[schemas.UserResponse])
@@ -277,15 +543,20 @@ def get_user_following(
 ):
     """Get users that this user follows"""
     following_ids = social_graph.get_following(user_id)
-    following = db.query(models.User).filter(models.User.id.in_(following_ids)).all()
-    return following
+    rows = query_user_records(db).filter(models.User.id.in_(following_ids)).all()
+    return list_response(schemas.USER_LIST_ADAPTER, [UserRecord(*row) for row in rows])
 
 
 # ==================== POST ENDPOINTS ====================
 
-@app.post("/posts", response_model=schemas.PostResponse, status_code=status.HTTP_201_CREATED)
+@app.post(
+    "/posts",
+    response_model=schemas.PostResponse,
+    status_code=status.HTTP_201_CREATED,
+    openapi_extra=json_body_docs(schemas.PostCreate)
+)
 def create_post(
-    post: schemas.PostCreate,
+    post: schemas.PostCreate = Depends(json_body(schemas.PostCreate)),
     current_user: models.User = Depends(auth.get_current_active_user),
     db: Session = Depends(get_db)
 ):
@@ -293,33 +564,35 @@ def create_post(
     db_post = models.Post(**post.model_dump(), author_id=current_user.id)
     db.add(db_post)
     db.commit()
-    db.refresh(db_post)
     
     # Add counts
     db_post.likes_count = 0
     db_post.comments_count = 0
     
-    return db_post
+    return model_response(schemas.PostResponse, db_post, status.HTTP_201_CREATED)
 
 
 @app.get("/posts", response_model=List[schemas.PostResponse])
 def get_all_posts(
     skip: int = 0,
     limit: int = 20,
+    after_id: Optional[int] = None,
     current_user: models.User = Depends(auth.get_current_active_user),
     db: Session = Depends(get_db)
 ):
-    """Get all posts (paginated)"""
-    posts = db.query(models.Post).filter(
-        models.Post.published == True
-    ).order_by(models.Post.created_at.desc()).offset(skip).limit(limit).all()
+    """
+    Get all posts (paginated)
+    Pass the last post's id as after_id to fetch the next page by key instead of skip
+    """
+    query = query_post_records(db).filter(models.Post.published == True)
+    if after_id is not None:
+        query = query.filter(posts_after(after_id))
     
-    # Add counts
-    for post in posts:
-        post.likes_count = len(post.liked_by)
-        post.comments_count = len(post.comments)
+    rows = query.order_by(
+        models.Post.created_at.desc(), models.Post.id.desc()
+    ).offset(skip).limit(limit).all()
     
-    return posts
+    return list_response(schemas.POST_LIST_ADAPTER, [post_record(row) for row in rows])
 
 
 @app.get("/posts/{post_id}", response_model=schemas.PostResponse)
@@ -329,14 +602,11 @@ def get_post(
     db: Session = Depends(get_db)
 ):
     """Get a specific post"""
-    post = db.query(models.Post).filter(models.Post.id == post_id).first()
-    if not post:
+    row = query_post_records(db).filter(models.Post.id == post_id).first()
+    if not row:
         raise HTTPException(status_code=404, detail="Post not found")
     
-    post.likes_count = len(post.liked_by)
-    post.comments_count = len(post.comments)
-    
-    return post
+    return model_response(schemas.PostResponse, post_record(row))
 
 
 @app.put("/posts/{post_id}", response_model=schemas.PostResponse)
@@ -355,22 +625,17 @@ def update_post(
         raise HTTPException(status_code=403, detail="Not authorized to update this post")
     
     # Update fields
-    if post_update.title is not None:
-        post.title = post_update.title
-    if post_update.content is not None:
-        post.content = post_update.content
-    if post_update.image_url is not None:
-        post.image_url = post_update.image_url
-    if post_update.published is not None:
-        post.published = post_update.published
+    for field, value in post_update.changed_fields().items():
+        setattr(post, field, value)
     
     db.commit()
-    db.refresh(post)
     
-    post.likes_count = len(post.liked_by)
-    post.comments_count = len(post.comments)
+    # Both counts in one SELECT instead of loading the likes and comments collections
+    post.likes_count, post.comments_count = db.query(
+        post_likes_count, post_comments_count
+    ).select_from(models.Post).filter(models.Post.id == post_id).one()
     
-    return post
+    return model_response(schemas.PostResponse, post)
 
 
 @app.delete("/posts/{post_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -380,14 +645,18 @@ def delete_post(
     db: Session = Depends(get_db)
 ):
     """Delete a post (only by author)"""
-    post = db.query(models.Post).filter(models.Post.id == post_id).first()
-    if not post:
-        raise HTTPException(status_code=404, detail="Post not found")
-    
-    if post.author_id != current_user.id:
+    # Single DELETE scoped to the author; likes and comments go via ON DELETE CASCADE
+    deleted = db.query(models.Post).filter(
+        models.Post.id == post_id,
+        models.Post.author_id == current_user.id
+    ).delete(synchronize_session=False)
+    
+    if not deleted:
+        # Only the failure path pays for telling "missing" from "not yours"
+        if not db.query(exists().where(models.Post.id == post_id)).scalar():
+            raise HTTPException(status_code=404, detail="Post not found")
         raise HTTPException(status_code=403, detail="Not authorized to delete this post")
     
-    db.delete(post)
     db.commit()
     return None
 
@@ -399,16 +668,12 @@ def get_user_posts(
     db: Session = Depends(get_db)
 ):
     """Get all posts by a specific user"""
-    posts = db.query(models.Post).filter(
+    rows = query_post_records(db).filter(
         models.Post.author_id == user_id,
         models.Post.published == True
     ).order_by(models.Post.created_at.desc()).all()
     
-    for post in posts:
-        post.likes_count = len(post.liked_by)
-        post.comments_count = len(post.comments)
-    
-    return posts
+    return list_response(schemas.POST_LIST_ADAPTER, [post_record(row) for row in rows])
 
 
 # ==================== LIKE ENDPOINTS ====================
@@ -424,13 +689,19 @@ def like_post(
     if not post:
         raise HTTPException(status_code=404, detail="Post not found")
     
-    if current_user in post.liked_by:
+    if association_exists(db, models.post_likes, user_id=current_user.id, post_id=post_id):
         raise HTTPException(status_code=400, detail="Already liked this post")
     
-    post.liked_by.append(current_user)
-    db.commit()
+    # A concurrent duplicate like hits the unique pair index
+    try:
+        db.execute(models.post_likes.insert().values(user_id=current_user.id, post_id=post_id))
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(status_code=400, detail="Already liked this post")
     
-    return {"message": "Post liked successfully", "likes_count": len(post.liked_by)}
+    likes_count = count_likes(db, models.post_likes, post_id=post_id)
+    return {"message": "Post liked successfully", "likes_count": likes_count}
 
 
 @app.delete("/posts/{post_id}/like")
@@ -444,20 +715,29 @@ def unlike_post(
     if not post:
         raise HTTPException(status_code=404, detail="Post not found")
     
-    if current_user not in post.liked_by:
+    if not association_exists(db, models.post_likes, user_id=current_user.id, post_id=post_id):
         raise HTTPException(status_code=400, detail="You haven't liked this post")
     
-    post.liked_by.remove(current_user)
+    db.execute(models.post_likes.delete().where(
+        models.post_likes.c.user_id == current_user.id,
+        models.post_likes.c.post_id == post_id
+    ))
     db.commit()
     
-    return {"message": "Post unliked successfully", "likes_count": len(post.liked_by)}
+    likes_count = count_likes(db, models.post_likes, post_id=post_id)
+    return {"message": "Post unliked successfully", "likes_count": likes_count}
 
 
 # ==================== COMMENT ENDPOINTS ====================
 
-@app.post("/comments", response_model=schemas.CommentResponse, status_code=status.HTTP_201_CREATED)
+@app.post(
+    "/comments",
+    response_model=schemas.CommentResponse,
+    status_code=status.HTTP_201_CREATED,
+    openapi_extra=json_body_docs(schemas.CommentCreate)
+)
 def create_comment(
-    comment: schemas.CommentCreate,
+    comment: schemas.CommentCreate = Depends(json_body(schemas.CommentCreate)),
     current_user: models.User = Depends(auth.get_current_active_user),
     db: Session = Depends(get_db)
 ):
@@ -473,11 +753,10 @@ def create_comment(
     )
     db.add(db_comment)
     db.commit()
-    db.refresh(db_comment)
     
     db_comment.likes_count = 0
     
-    return db_comment
+    return model_response(schemas.CommentResponse, db_comment, status.HTTP_201_CREATED)
 
 
 @app.get("/posts/{post_id}/comments", response_model=List[schemas.CommentResponse])
@@ -487,14 +766,18 @@ def get_post_comments(
     db: Session = Depends(get_db)
 ):
     """Get all comments for a post"""
-    comments = db.query(models.Comment).filter(
+    rows = db.query(models.Comment, comment_likes_count).options(
+        selectinload(models.Comment.author)
+    ).filter(
         models.Comment.post_id == post_id
     ).order_by(models.Comment.created_at.desc()).all()
     
-    for comment in comments:
-        comment.likes_count = len(comment.liked_by)
+    comments = []
+    for comment, likes_count in rows:
+        comment.likes_count = likes_count
+        comments.append(comment)
     
-    return comments
+    return list_response(schemas.COMMENT_LIST_ADAPTER, comments)
 
 
 @app.put("/comments/{comment_id}", response_model=schemas.CommentResponse)
@@ -514,11 +797,10 @@ def update_comment(
     
     comment.content = comment_update.content
     db.commit()
-    db.refresh(comment)
     
-    comment.likes_count = len(comment.liked_by)
+    comment.likes_count = count_likes(db, models.comment_likes, comment_id=comment_id)
     
-    return comment
+    return model_response(schemas.CommentResponse, comment)
 
 
 @app.delete("/comments/{comment_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -528,14 +810,17 @@ def delete_comment(
     db: Session = Depends(get_db)
 ):
     """Delete a comment (only by author)"""
-    comment = db.query(models.Comment).filter(models.Comment.id == comment_id).first()
-    if not comment:
-        raise HTTPException(status_code=404, detail="Comment not found")
-    
-    if comment.author_id != current_user.id:
+    # Single DELETE scoped to the author; likes go via ON DELETE CASCADE
+    deleted = db.query(models.Comment).filter(
+        models.Comment.id == comment_id,
+        models.Comment.author_id == current_user.id
+    ).delete(synchronize_session=False)
+    
+    if not deleted:
+        if not db.query(exists().where(models.Comment.id == comment_id)).scalar():
+            raise HTTPException(status_code=404, detail="Comment not found")
         raise HTTPException(status_code=403, detail="Not authorized to delete this comment")
     
-    db.delete(comment)
     db.commit()
     return None
 
@@ -551,13 +836,19 @@ def like_comment(
     if not comment:
         raise HTTPException(status_code=404, detail="Comment not found")
     
-    if current_user in comment.liked_by:
+    if association_exists(db, models.comment_likes, user_id=current_user.id, comment_id=comment_id):
         raise HTTPException(status_code=400, detail="Already liked this comment")
     
-    comment.liked_by.append(current_user)
-    db.commit()
+    # A concurrent duplicate like hits the unique pair index
+    try:
+        db.execute(models.comment_likes.insert().values(user_id=current_user.id, comment_id=comment_id))
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(status_code=400, detail="Already liked this comment")
     
-    return {"message": "Comment liked successfully", "likes_count": len(comment.liked_by)}
+    likes_count = count_likes(db, models.comment_likes, comment_id=comment_id)
+    return {"message": "Comment liked successfully", "likes_count": likes_count}
 
 
 @app.delete("/comments/{comment_id}/like")
@@ -571,13 +862,17 @@ def unlike_comment(
     if not comment:
         raise HTTPException(status_code=404, detail="Comment not found")
     
-    if current_user not in comment.liked_by:
+    if not association_exists(db, models.comment_likes, user_id=current_user.id, comment_id=comment_id):
         raise HTTPException(status_code=400, detail="You haven't liked this comment")
     
-    comment.liked_by.remove(current_user)
+    db.execute(models.comment_likes.delete().where(
+        models.comment_likes.c.user_id == current_user.id,
+        models.comment_likes.c.comment_id == comment_id
+    ))
     db.commit()
     
-    return {"message": "Comment unliked successfully", "likes_count": len(comment.liked_by)}
+    likes_count = count_likes(db, models.comment_likes, comment_id=comment_id)
+    return {"message": "Comment unliked successfully", "likes_count": likes_count}
 
 
 # ==================== FEED ENDPOINT ====================
@@ -586,23 +881,29 @@ def unlike_comment(
 def get_feed(
     skip: int = 0,
     limit: int = 20,
+    after_id: Optional[int] = None,
     current_user: models.User = Depends(auth.get_current_active_user),
     db: Session = Depends(get_db)
 ):
-    """Get personalized feed (posts from followed users + own posts)"""
+    """
+    Get personalized feed (posts from followed users + own posts)
+    Pass the last post's id as after_id to fetch the next page by key instead of skip
+    """
     following_ids = social_graph.get_following(current_user.id)
     following_ids.append(current_user.id)  # Include user's own posts
     
-    posts = db.query(models.Post).filter(
+    query = query_post_records(db).filter(
         models.Post.author_id.in_(following_ids),
         models.Post.published == True
-    ).order_by(models.Post.created_at.desc()).offset(skip).limit(limit).all()
+    )
+    if after_id is not None:
+        query = query.filter(posts_after(after_id))
     
-    for post in posts:
-        post.likes_count = len(post.liked_by)
-        post.comments_count = len(post.comments)
+    rows = query.order_by(
+        models.Post.created_at.desc(), models.Post.id.desc()
+    ).offset(skip).limit(limit).all()
     
-    return posts
+    return list_response(schemas.POST_LIST_ADAPTER, [post_record(row) for row in rows])
 
 
 # ==================== GRAPH-BASED FEATURES ====================
@@ -620,13 +921,13 @@ def get_user_suggestions(
         return []
     
     suggested_user_ids = [user_id for user_id, score in suggestions]
-    users = db.query(models.User).filter(models.User.id.in_(suggested_user_ids)).all()
+    rows = query_user_records(db).filter(models.User.id.in_(suggested_user_ids)).all()
     
     # Sort by the original score order
-    user_dict = {user.id: user for user in users}
+    user_dict = {row.id: UserRecord(*row) for row in rows}
     sorted_users = [user_dict[user_id] for user_id, score in suggestions if user_id in user_dict]
     
-    return sorted_users
+    return list_response(schemas.USER_LIST_ADAPTER, sorted_users)
 
 
 @app.get("/graph/connection/{user_id}")
@@ -671,14 +972,21 @@ def get_mutual_connections(
     mutual_following = social_graph.get_mutual_followers(current_user.id, user_id)
     mutual_friends = social_graph.get_mutual_friends(current_user.id, user_id)
     
-    following_users = db.query(models.User).filter(models.User.id.in_(mutual_following)).all()
-    friend_users = db.query(models.User).filter(models.User.id.in_(mutual_friends)).all()
+    # One round-trip for both lists; users in both sets are fetched once
+    rows = db.query(models.User.id, models.User.username).filter(
+        models.User.id.in_(mutual_following | mutual_friends)
+    ).all()
+    usernames = dict(rows)
     
     return {
         "mutual_following_count": len(mutual_following),
-        "mutual_following": [{"id": u.id, "username": u.username} for u in following_users],
+        "mutual_following": [
+            {"id": uid, "username": usernames[uid]} for uid in sorted(mutual_following) if uid in usernames
+        ],
         "mutual_friends_count": len(mutual_friends),
-        "mutual_friends": [{"id": u.id, "username": u.username} for u in friend_users]
+        "mutual_friends": [
+            {"id": uid, "username": usernames[uid]} for uid in sorted(mutual_friends) if uid in usernames
+        ]
     }
 
 
@@ -690,13 +998,22 @@ def get_influencers(
     db: Session = Depends(get_db)
 ):
     """Get most influential users (users with most followers)"""
+    # Same for every user, so the cache key is not user-scoped
+    cache_key = ("influencers", min_followers, limit)
+    cached = get_cached_graph_response(cache_key)
+    if cached is not None:
+        return cached
+    generation = get_graph_cache_generation()
+    
     influencers = social_graph.get_influencers(min_followers, limit)
     
     if not influencers:
         return []
     
     influencer_ids = [user_id for user_id, count in influencers]
-    users = db.query(models.User).filter(models.User.id.in_(influencer_ids)).all()
+    users = db.query(models.User.id, models.User.username, models.User.full_name).filter(
+        models.User.id.in_(influencer_ids)
+    ).all()
     
     # Create response with follower counts
     user_dict = {user.id: user for user in users}
@@ -711,6 +1028,7 @@ def get_influencers(
                 "follower_count": follower_count
             })
     
+    cache_graph_response(cache_key, result, generation)
     return result
 
 
@@ -719,13 +1037,20 @@ def get_network_statistics(
     current_user: models.User = Depends(auth.get_current_active_user)
 ):
     """Get overall network statistics"""
+    cache_key = ("network-stats", current_user.id)
+    cached = get_cached_graph_response(cache_key)
+    if cached is not None:
+        return cached
+    generation = get_graph_cache_generation()
+    
     stats = social_graph.get_network_stats()
     
     # Add user-specific stats
-    stats["your_followers"] = len(social_graph.get_followers(current_user.id))
-    stats["your_following"] = len(social_graph.get_following(current_user.id))
+    stats["your_followers"] = social_graph.get_followers_count(current_user.id)
+    stats["your_following"] = social_graph.get_following_count(current_user.id)
     stats["your_community_size"] = social_graph.get_community_size(current_user.id, max_depth=2)
     
+    cache_graph_response(cache_key, stats, generation)
     return stats
 
 
@@ -736,13 +1061,21 @@ def get_popular_in_my_network(
     db: Session = Depends(get_db)
 ):
     """Get most popular users within your network"""
+    cache_key = ("popular-in-network", current_user.id, limit)
+    cached = get_cached_graph_response(cache_key)
+    if cached is not None:
+        return cached
+    generation = get_graph_cache_generation()
+    
     popular = social_graph.get_popular_in_network(current_user.id, limit)
     
     if not popular:
         return []
     
     popular_ids = [user_id for user_id, count in popular]
-    users = db.query(models.User).filter(models.User.id.in_(popular_ids)).all()
+    users = db.query(models.User.id, models.User.username, models.User.full_name).filter(
+        models.User.id.in_(popular_ids)
+    ).all()
     
     user_dict = {user.id: user for user in users}
     result = []
@@ -756,6 +1089,7 @@ def get_popular_in_my_network(
                 "follower_count": follower_count
             })
     
+    cache_graph_response(cache_key, result, generation)
     return result
 
 
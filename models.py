@@ -1,14 +1,24 @@
-from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, Table, Text, DateTime
+from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, Table, Text, DateTime, Index
 from sqlalchemy.orm import relationship
 from database import Base
 from datetime import datetime
 
+
+# DateTime compiles to MySQL DATETIME, which stores whole seconds. Timestamps are
+# truncated to match, so the values a create/update response serializes from the
+# instance (sessions don't expire or refresh it after commit) equal what a later
+# read returns.
+def utcnow() -> datetime:
+    return datetime.utcnow().replace(microsecond=0)
+
 # Association table for followers (many-to-many)
 followers = Table(
     'followers',
     Base.metadata,
     Column('follower_id', Integer, ForeignKey('users.id', ondelete='CASCADE')),
-    Column('followed_id', Integer, ForeignKey('users.id', ondelete='CASCADE'))
+    Column('followed_id', Integer, ForeignKey('users.id', ondelete='CASCADE')),
+    # Backs the follow EXISTS checks and prevents duplicate follows
+    Index('ix_followers_pair', 'follower_id', 'followed_id', unique=True)
 )
 
 # Association table for post likes (many-to-many)
@@ -16,7 +26,8 @@ post_likes = Table(
     'post_likes',
     Base.metadata,
     Column('user_id', Integer, ForeignKey('users.id', ondelete='CASCADE')),
-    Column('post_id', Integer, ForeignKey('posts.id', ondelete='CASCADE'))
+    Column('post_id', Integer, ForeignKey('posts.id', ondelete='CASCADE')),
+    Index('ix_post_likes_pair', 'user_id', 'post_id', unique=True)
 )
 
 # Association table for comment likes (many-to-many)
@@ -24,7 +35,8 @@ comment_likes = Table(
     'comment_likes',
     Base.metadata,
     Column('user_id', Integer, ForeignKey('users.id', ondelete='CASCADE')),
-    Column('comment_id', Integer, ForeignKey('comments.id', ondelete='CASCADE'))
+    Column('comment_id', Integer, ForeignKey('comments.id', ondelete='CASCADE')),
+    Index('ix_comment_likes_pair', 'user_id', 'comment_id', unique=True)
 )
 
 
@@ -37,7 +49,7 @@ class User(Base):
     hashed_password = Column(String(255), nullable=False)
     full_name = Column(String(100))
     bio = Column(Text)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, default=utcnow)
     is_active = Column(Boolean, default=True)
     
     # Relationships
@@ -50,7 +62,16 @@ class User(Base):
         secondary=followers,
         primaryjoin=(followers.c.follower_id == id),
         secondaryjoin=(followers.c.followed_id == id),
-        backref="followers_list"
+        back_populates="followers_list"
+    )
+    
+    # Users following this user
+    followers_list = relationship(
+        "User",
+        secondary=followers,
+        primaryjoin=(followers.c.followed_id == id),
+        secondaryjoin=(followers.c.follower_id == id),
+        back_populates="following"
     )
     
     # Posts this user has liked
@@ -67,8 +88,8 @@ class Post(Base):
     title = Column(String(200), nullable=False)
     content = Column(Text, nullable=False)
     image_url = Column(String(500))
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, default=utcnow)
+    updated_at = Column(DateTime, default=utcnow, onupdate=utcnow)
     published = Column(Boolean, default=True)
     author_id = Column(Integer, ForeignKey('users.id', ondelete='CASCADE'), nullable=False)
     
@@ -76,6 +97,14 @@ class Post(Base):
     author = relationship("User", back_populates="posts")
     comments = relationship("Comment", back_populates="post", cascade="all, delete-orphan")
     liked_by = relationship("User", secondary=post_likes, back_populates="liked_posts")
+    
+    __table_args__ = (
+        # Per-author listings and the feed: author_id = / IN (...), published,
+        # ordered by created_at; read backwards for newest-first
+        Index('ix_posts_author_published_created', 'author_id', 'published', 'created_at'),
+        # Global post list and its (created_at, id) keyset pagination
+        Index('ix_posts_published_created', 'published', 'created_at', 'id'),
+    )
 
 
 class Comment(Base):
@@ -83,12 +112,17 @@ class Comment(Base):
     
     id = Column(Integer, primary_key=True, index=True)
     content = Column(Text, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, default=utcnow)
+    updated_at = Column(DateTime, default=utcnow, onupdate=utcnow)
     author_id = Column(Integer, ForeignKey('users.id', ondelete='CASCADE'), nullable=False)
     post_id = Column(Integer, ForeignKey('posts.id', ondelete='CASCADE'), nullable=False)
     
     # Relationships
     author = relationship("User", back_populates="comments")
     post = relationship("Post", back_populates="comments")
-    liked_by = relationship("User", secondary=comment_likes, back_populates="liked_comments")
\ No newline at end of file
+    liked_by = relationship("User", secondary=comment_likes, back_populates="liked_comments")
+    
+    __table_args__ = (
+        # Comments of a post, newest first
+        Index('ix_comments_post_created', 'post_id', 'created_at'),
+    )
\ No newline at end of file
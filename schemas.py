@@ -1,32 +1,66 @@
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, TypeAdapter, constr
 from typing import Optional, List
 from datetime import datetime
+from dataclasses import dataclass
+
+# Cheap shape check for emails coming back from the database; pydantic-core
+# matches it natively. Full EmailStr parsing is kept for untrusted input only
+EMAIL_PATTERN = r"^[^@\s]+@[^@\s]+\.[^@\s]+$"
+
+# Length limits for TEXT columns. They apply to request bodies only, so rows
+# written before the limits existed still serialize; VARCHAR fields use their
+# column sizes from models.py on both sides
+BIO_MAX_LENGTH = 500
+POST_CONTENT_MAX_LENGTH = 10000
+COMMENT_CONTENT_MAX_LENGTH = 2000
+
+# Rules for new accounts, compiled into the schema once and checked natively
+Username = constr(min_length=3, max_length=50, pattern=r"^[A-Za-z0-9_]+$")
+Password = constr(min_length=8, max_length=128)
+
+
+# Base for response models read from ORM objects and row records; they are
+# built once per response and never modified, so instances are frozen
+class ORMModel(BaseModel):
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+
+# Base for partial-update bodies: only the fields a client sends are applied
+class UpdateModel(BaseModel):
+    def changed_fields(self) -> dict:
+        """Fields explicitly sent in the request with a non-null value"""
+        changed = {}
+        for name in self.model_fields_set:
+            value = getattr(self, name)
+            if value is not None:
+                changed[name] = value
+        return changed
 
 
 # User Schemas
 class UserBase(BaseModel):
-    username: str
-    email: EmailStr
-    full_name: Optional[str] = None
+    username: str = Field(max_length=50)
+    email: str = Field(max_length=100, pattern=EMAIL_PATTERN)
+    full_name: Optional[str] = Field(None, max_length=100)
     bio: Optional[str] = None
 
 
 class UserCreate(UserBase):
-    password: str
+    username: Username
+    email: EmailStr = Field(max_length=100)
+    bio: Optional[str] = Field(None, max_length=BIO_MAX_LENGTH)
+    password: Password
 
 
-class UserUpdate(BaseModel):
-    full_name: Optional[str] = None
-    bio: Optional[str] = None
+class UserUpdate(UpdateModel):
+    full_name: Optional[str] = Field(None, max_length=100)
+    bio: Optional[str] = Field(None, max_length=BIO_MAX_LENGTH)
 
 
-class UserResponse(UserBase):
+class UserResponse(UserBase, ORMModel):
     id: int
     created_at: datetime
     is_active: bool
-    
-    class Config:
-        from_attributes = True
 
 
 class UserWithStats(UserResponse):
@@ -37,24 +71,24 @@ class UserWithStats(UserResponse):
 
 # Post Schemas
 class PostBase(BaseModel):
-    title: str
+    title: str = Field(max_length=200)
     content: str
-    image_url: Optional[str] = None
+    image_url: Optional[str] = Field(None, max_length=500)
     published: bool = True
 
 
 class PostCreate(PostBase):
-    pass
+    content: str = Field(max_length=POST_CONTENT_MAX_LENGTH)
 
 
-class PostUpdate(BaseModel):
-    title: Optional[str] = None
-    content: Optional[str] = None
-    image_url: Optional[str] = None
+class PostUpdate(UpdateModel):
+    title: Optional[str] = Field(None, max_length=200)
+    content: Optional[str] = Field(None, max_length=POST_CONTENT_MAX_LENGTH)
+    image_url: Optional[str] = Field(None, max_length=500)
     published: Optional[bool] = None
 
 
-class PostResponse(PostBase):
+class PostResponse(PostBase, ORMModel):
     id: int
     created_at: datetime
     updated_at: datetime
@@ -62,9 +96,6 @@ class PostResponse(PostBase):
     author: UserResponse
     likes_count: int
     comments_count: int
-    
-    class Config:
-        from_attributes = True
 
 
 # Comment Schemas
@@ -73,14 +104,15 @@ class CommentBase(BaseModel):
 
 
 class CommentCreate(CommentBase):
+    content: str = Field(max_length=COMMENT_CONTENT_MAX_LENGTH)
     post_id: int
 
 
-class CommentUpdate(BaseModel):
-    content: str
+class CommentUpdate(UpdateModel):
+    content: str = Field(max_length=COMMENT_CONTENT_MAX_LENGTH)
 
 
-class CommentResponse(CommentBase):
+class CommentResponse(CommentBase, ORMModel):
     id: int
     created_at: datetime
     updated_at: datetime
@@ -88,29 +120,53 @@ class CommentResponse(CommentBase):
     post_id: int
     author: UserResponse
     likes_count: int
-    
-    class Config:
-        from_attributes = True
 
 
 # Authentication Schemas
-class Token(BaseModel):
+# Plain dataclasses: auth DTOs never need BaseModel methods, so instances stay
+# small and are validated/encoded through module-level adapters
+@dataclass(frozen=True)
+class Token:
     access_token: str
     token_type: str
 
 
-class TokenData(BaseModel):
+@dataclass(frozen=True)
+class TokenData:
     username: Optional[str] = None
 
 
+# Built once: login encodes a Token and get_current_user validates a TokenData
+# on every authenticated request
+TOKEN_ADAPTER = TypeAdapter(Token)
+TOKEN_DATA_ADAPTER = TypeAdapter(TokenData)
+
+
 class LoginRequest(BaseModel):
     username: str
     password: str
 
 
 # Feed Schema
-class FeedPost(PostResponse):
+# Declared flat rather than extending PostResponse (-> PostBase) so the model
+# is built from a single class body
+class FeedPost(ORMModel):
+    title: str
+    content: str
+    image_url: Optional[str] = None
+    published: bool = True
+    id: int
+    created_at: datetime
+    updated_at: datetime
+    author_id: int
+    author: UserResponse
+    likes_count: int
+    comments_count: int
     is_liked_by_user: bool
-    
-    class Config:
-        from_attributes = True
\ No newline at end of file
+
+
+# List response adapters, built once at import; each validates and encodes a
+# whole list response in a single pydantic-core call
+USER_LIST_ADAPTER = TypeAdapter(List[UserResponse])
+POST_LIST_ADAPTER = TypeAdapter(List[PostResponse])
+COMMENT_LIST_ADAPTER = TypeAdapter(List[CommentResponse])
\ No newline at end of file
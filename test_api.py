@@ -0,0 +1,79 @@
+import os
+import tempfile
+import unittest
+
+# Point the app at a throwaway SQLite database before main creates its engine
+DB_PATH = os.path.join(tempfile.mkdtemp(), "test.db")
+os.environ["DATABASE_URL"] = f"sqlite:///{DB_PATH}"
+os.environ.setdefault("SECRET_KEY", "test-secret")
+os.environ.setdefault("ALGORITHM", "HS256")
+os.environ.setdefault("ACCESS_TOKEN_EXPIRE_MINUTES", "30")
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+
+from fastapi.testclient import TestClient
+
+import main
+
+
+class TimestampTests(unittest.TestCase):
+    """Create and update responses must report the timestamps a later GET returns"""
+    
+    @classmethod
+    def setUpClass(cls):
+        cls.client = TestClient(main.app)
+        cls.client.__enter__()
+        cls.registered = cls.client.post("/register", json={
+            "username": "alice", "email": "alice@example.com", "password": "password123"
+        }).json()
+        token = cls.client.post(
+            "/login", data={"username": "alice", "password": "password123"}
+        ).json()["access_token"]
+        cls.headers = {"Authorization": f"Bearer {token}"}
+    
+    @classmethod
+    def tearDownClass(cls):
+        cls.client.__exit__(None, None, None)
+    
+    def assert_same_timestamps(self, written: dict, read: dict):
+        for field in ("created_at", "updated_at"):
+            self.assertEqual(written[field], read[field])
+            # MySQL DATETIME keeps whole seconds only
+            self.assertNotIn(".", written[field])
+    
+    def test_register_matches_get(self):
+        fetched = self.client.get("/users/me", headers=self.headers).json()
+        self.assertEqual(self.registered["created_at"], fetched["created_at"])
+        self.assertNotIn(".", self.registered["created_at"])
+    
+    def test_post_create_and_update_match_get(self):
+        created = self.client.post(
+            "/posts", headers=self.headers, json={"title": "Hello", "content": "First post"}
+        ).json()
+        fetched = self.client.get(f"/posts/{created['id']}", headers=self.headers).json()
+        self.assert_same_timestamps(created, fetched)
+        
+        updated = self.client.put(
+            f"/posts/{created['id']}", headers=self.headers, json={"content": "Edited"}
+        ).json()
+        fetched = self.client.get(f"/posts/{created['id']}", headers=self.headers).json()
+        self.assert_same_timestamps(updated, fetched)
+    
+    def test_comment_create_and_update_match_get(self):
+        post_id = self.client.post(
+            "/posts", headers=self.headers, json={"title": "Hello", "content": "Post"}
+        ).json()["id"]
+        created = self.client.post(
+            "/comments", headers=self.headers, json={"content": "Nice", "post_id": post_id}
+        ).json()
+        fetched = self.client.get(f"/posts/{post_id}/comments", headers=self.headers).json()[0]
+        self.assert_same_timestamps(created, fetched)
+        
+        updated = self.client.put(
+            f"/comments/{created['id']}", headers=self.headers, json={"content": "Edited"}
+        ).json()
+        fetched = self.client.get(f"/posts/{post_id}/comments", headers=self.headers).json()[0]
+        self.assert_same_timestamps(updated, fetched)
+
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
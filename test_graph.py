@@ -0,0 +1,37 @@
+import random
+import unittest
+
+from graph import SocialGraph
+
+
+class BatchDegreesOfSeparationTests(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(7)
+        self.graph = SocialGraph()
+        self.user_ids = list(range(1, 61))
+        for user_id in self.user_ids:
+            self.graph.add_user(user_id)
+        for _ in range(120):
+            follower_id, followed_id = rng.sample(self.user_ids, 2)
+            self.graph.follow_user(follower_id, followed_id)
+    
+    def test_matches_per_pair_degrees(self):
+        # Include unknown users on both sides and self pairs
+        candidates = self.user_ids + [998, 999]
+        pairs = [(source, target) for source in candidates for target in candidates]
+        
+        expected = [self.graph.get_degrees_of_separation(source, target) for source, target in pairs]
+        self.assertEqual(self.graph.batch_degrees_of_separation(pairs), expected)
+    
+    def test_unknown_target_does_not_force_full_traversal(self):
+        chain = SocialGraph()
+        for user_id in range(1, 10):
+            chain.follow_user(user_id, user_id + 1)
+        
+        distances = chain._bfs_distances(1, {2, 999})
+        self.assertEqual(distances[2], 1)
+        self.assertNotIn(10, distances)
+
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file